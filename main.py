@@ -1,9 +1,17 @@
 import asyncio
 import os
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 from src.metrics.service import MetricsService
 
-os.environ.setdefault("MQ_FILE_PATH", os.path.join(os.getcwd(), "mq_files/windows"))
+os.environ.setdefault(
+    "MQ_FILE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "mq_files", "windows"),
+)
 import signal
 from src.bindings.bindings import Bindings
 from src.common.log import get_logger
@@ -14,25 +22,25 @@ logger = get_logger("main")
 shutdown_event = asyncio.Event()
 
 
-def handle_signal(sig, frame):
+def handle_signal(sig):
     """Handle termination signals from Kubernetes"""
     logger.info(f"Received signal {sig}. Starting graceful shutdown...")
-    # Use a safer way to set the event
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        # If no loop is running, create a new one
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    loop.call_soon_threadsafe(shutdown_event.set)
+    shutdown_event.set()
 
 
 async def main():
     bindings: Bindings | None = None
     metrics_service = MetricsService(port=9000)
     try:
+        loop = asyncio.get_running_loop()
         for sig in (signal.SIGTERM, signal.SIGINT):
-            signal.signal(sig, handle_signal)
+            try:
+                loop.add_signal_handler(sig, handle_signal, sig)
+            except NotImplementedError:
+                # Windows event loops do not support add_signal_handler
+                signal.signal(
+                    sig, lambda s, _: loop.call_soon_threadsafe(handle_signal, s)
+                )
         logger.info("Starting KubeMQ - IBM MQ bindings")
         bindings = Bindings(config_path, metrics_service)
         bindings.init()
@@ -56,7 +64,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt, shutting down...")
     except Exception as e:
@@ -1,6 +1,7 @@
-from typing import Dict, Any
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple
 
-from src.bindings.config import BindingConfig, BindingType
+from src.bindings.config import BINDING_SIDES, BindingConfig
 from src.bindings.connection import Connection
 from src.bindings.exceptions import BindingConfigError
 from src.common.log import get_logger
@@ -11,15 +12,36 @@ from src.ibm_mq.config import Config as IBMMQConfig
 from src.metrics.binding import BindingMetricsHelper
 from src.bindings.retry import RetryWrapper
 
+# Client class and error label of each connection config class
+CONNECTION_CLIENTS = {
+    IBMMQConfig: (IBMMQClient, "ibmmq"),
+    KubeMQConfig: (KubeMQClient, "kubemq"),
+}
+
 
 class Binding:
+    __slots__ = (
+        "config",
+        "name",
+        "type_value",
+        "source_metrics",
+        "target_metrics",
+        "source",
+        "target",
+        "send_message",
+        "logger",
+    )
+
     def __init__(self, config: BindingConfig, source_metrics: BindingMetricsHelper, target_metrics: BindingMetricsHelper):
         self.config = config
+        self.name = config.name
+        self.type_value = config.type.value if config.type else None
         self.source_metrics = source_metrics
         self.target_metrics = target_metrics
         self.source: Connection | None = None
         self.target: Connection | None = None
-        self.logger = get_logger(f"binding.{self.config.name}")
+        self.send_message: Callable[[bytes], Awaitable[Any]] | None = None
+        self.logger = get_logger(f"binding.{self.name}")
 
     def init(self):
         """
@@ -27,87 +49,96 @@ class Binding:
         based on binding type, initializes them, and passes metrics helpers.
         """
 
-        if self.config.type == BindingType.IBM_MQ_TO_KUBEMQ:
-            source_client_cls, source_config_cls, source_err = (
-                IBMMQClient,
-                IBMMQConfig,
-                "ibmmq source",
-            )
-            target_client_cls, target_config_cls, target_err = (
-                KubeMQClient,
-                KubeMQConfig,
-                "kubemq target",
-            )
-            source_metrics_helper = self.source_metrics
-            target_metrics_helper = self.target_metrics
-        elif self.config.type == BindingType.KUBEMQ_TO_IBM_MQ:
-            source_client_cls, source_config_cls, source_err = (
-                KubeMQClient,
-                KubeMQConfig,
-                "kubemq source",
-            )
-            target_client_cls, target_config_cls, target_err = (
-                IBMMQClient,
-                IBMMQConfig,
-                "ibmmq target",
-            )
-            source_metrics_helper = self.source_metrics
-            target_metrics_helper = self.target_metrics
-        else:
+        try:
+            (source_config_cls, _), (target_config_cls, _) = BINDING_SIDES[
+                self.config.type
+            ]
+        except KeyError:
             raise BindingConfigError(f"Unsupported binding type: {self.config.type}")
+        source_client_cls, source_label = CONNECTION_CLIENTS[source_config_cls]
+        target_client_cls, target_label = CONNECTION_CLIENTS[target_config_cls]
 
         # Initialize source
         try:
-            source_cfg = source_config_cls(**self.config.source.model_dump())
-            source_cfg.binding_name = self.config.name
-            source_cfg.binding_type = "source"
-            self.source = source_client_cls(source_cfg, source_metrics_helper)
+            source_cfg = self._connection_config(
+                source_config_cls, self.config.source, "source"
+            )
+            self.source = source_client_cls(source_cfg, self.source_metrics)
         except Exception as e:
-            msg = f"Error initializing {source_err}: {str(e)}"
+            msg = f"Error initializing {source_label} source: {str(e)}"
             self.logger.exception(msg)
-            raise BindingConfigError(msg)
+            raise BindingConfigError(msg) from e
 
         # Initialize target
         try:
-            target_cfg = target_config_cls(**self.config.target.model_dump())
-            target_cfg.binding_name = self.config.name
-            target_cfg.binding_type = "target"
-            self.target = target_client_cls(target_cfg, target_metrics_helper)
+            target_cfg = self._connection_config(
+                target_config_cls, self.config.target, "target"
+            )
+            self.target = target_client_cls(target_cfg, self.target_metrics)
         except Exception as e:
-            msg = f"Error initializing {target_err}: {str(e)}"
+            msg = f"Error initializing {target_label} target: {str(e)}"
             self.logger.exception(msg)
-            raise BindingConfigError(msg)
+            raise BindingConfigError(msg) from e
 
-    async def start(self):
-        await self.target.start()
-        await self.source.start()
-        
         # Create a wrapped version of target's send_message with retry logic
         if not self.config.retry.disable_retry:
             retry_wrapper = RetryWrapper(
                 max_retries=self.config.retry.max_retries,
                 delay_seconds=self.config.retry.delay_seconds,
-                logger=self.logger
+                max_delay_seconds=self.config.retry.max_delay_seconds,
+                logger=self.logger,
             )
-            
-            @retry_wrapper
-            async def wrapped_send_message(message: bytes):
-                try:
-                    return await self.target.send_message(message)
-                except Exception as e:
-                    self.logger.error(f"Error in target send_message: {str(e)}")
-                    # Re-raise to trigger retry logic
-                    raise
-            
-            await self.source.poll(wrapped_send_message)
+            self.send_message = retry_wrapper(self._send_message)
         else:
             # Use original callback if retry is disabled
-            await self.source.poll(self.target.send_message)
+            self.send_message = self.target.send_message
+
+    def _connection_config(self, config_cls, config, binding_type: str):
+        """Return the connection config tagged with this binding's name and side.
+
+        Configs loaded by BindingsConfig are already of the right class, so they
+        are copied without being dumped and validated again.
+        """
+        update = {"binding_name": self.name, "binding_type": binding_type}
+        if isinstance(config, config_cls):
+            return config.model_copy(update=update)
+        return config_cls(**{**config.model_dump(), **update})
+
+    async def start(self):
+        # Connecting source and target is independent, so overlap the handshakes
+        await asyncio.gather(self.target.start(), self.source.start())
+
+        await self.source.poll(self.send_message)
+
+    async def _send_message(self, message: bytes):
+        try:
+            return await self.target.send_message(message)
+        except Exception as e:
+            self.logger.error("Error in target send_message: {}", e)
+            # Re-raise to trigger retry logic
+            raise
 
     async def stop(self):
         await self.source.stop()
         await self.target.stop()
 
+    async def _probe_health(self) -> Tuple[bool, bool]:
+        """Check source and target health concurrently.
+
+        Returns:
+            Tuple of (source_healthy, target_healthy)
+        """
+        if self.source and self.target:
+            source_healthy, target_healthy = await asyncio.gather(
+                self.source.is_healthy(), self.target.is_healthy()
+            )
+            return source_healthy, target_healthy
+
+        # A side that was never initialized is unhealthy, no need to probe it
+        source_healthy = await self.source.is_healthy() if self.source else False
+        target_healthy = await self.target.is_healthy() if self.target else False
+        return source_healthy, target_healthy
+
     async def is_healthy(self) -> bool:
         """Check if the binding is healthy.
 
@@ -115,14 +146,13 @@ class Binding:
             bool: True if both source and target are healthy, False otherwise
         """
         try:
-            source_healthy = await self.source.is_healthy() if self.source else False
-            target_healthy = await self.target.is_healthy() if self.target else False
-
-            return source_healthy and target_healthy
+            source_healthy, target_healthy = await self._probe_health()
         except Exception as e:
-            self.logger.error(f"Error checking binding health: {str(e)}")
+            self.logger.error("Error checking binding health: {}", e)
             return False
 
+        return source_healthy and target_healthy
+
     async def get_detailed_health(self) -> Dict[str, Any]:
         """Get detailed health status including source and target.
 
@@ -130,32 +160,24 @@ class Binding:
             Dict containing health information for the binding and its components
         """
         try:
-            # Check source health
-            source_healthy = await self.source.is_healthy() if self.source else False
-
-            # Check target health
-            target_healthy = await self.target.is_healthy() if self.target else False
-
-            # Determine binding health
-            binding_healthy = source_healthy and target_healthy
-
-            # Create health response
-            health = {
-                "binding_name": self.config.name,
-                "binding_type": self.config.type.value,
-                "is_healthy": binding_healthy,
-                "source": {"is_healthy": source_healthy},
-                "target": {"is_healthy": target_healthy},
-            }
-
-            return health
+            # Check source and target health
+            source_healthy, target_healthy = await self._probe_health()
         except Exception as e:
-            self.logger.error(f"Error getting detailed health: {str(e)}")
+            self.logger.error("Error getting detailed health: {}", e)
             return {
-                "binding_name": self.config.name,
-                "binding_type": self.config.type.value,
+                "binding_name": self.name,
+                "binding_type": self.type_value,
                 "is_healthy": False,
                 "error": str(e),
                 "source": {"is_healthy": False},
                 "target": {"is_healthy": False},
             }
+
+        # Create health response
+        return {
+            "binding_name": self.name,
+            "binding_type": self.type_value,
+            "is_healthy": source_healthy and target_healthy,
+            "source": {"is_healthy": source_healthy},
+            "target": {"is_healthy": target_healthy},
+        }
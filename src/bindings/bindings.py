@@ -1,13 +1,54 @@
 import asyncio
-from typing import List, Dict, Any
+import os
+from typing import Any, Awaitable, Callable, Dict, Iterable, List
 
 from src.bindings.binding import Binding
-from src.bindings.config import BindingsConfig, BindingType, BindingConfig
+from src.bindings.config import BINDING_SIDES, BindingsConfig, BindingConfig
 from src.bindings.exceptions import BindingConfigError
 from src.common.log import get_logger
 from src.metrics.service import MetricsService
 from src.metrics.binding import BindingMetricsHelper
 
+# Maximum number of bindings probed at the same time during a health check
+HEALTH_CHECK_CONCURRENCY = 16
+
+# Time after which a binding's health check is reported as failed, so one
+# unresponsive binding does not hold up the report for all the others
+HEALTH_CHECK_TIMEOUT_SECONDS = 5.0
+
+# Default maximum number of bindings connecting or disconnecting at the same
+# time. IBM MQ connects and disconnects run in worker threads, so this bounds
+# how many channels are opened at once and how many threads they occupy
+DEFAULT_BINDING_LIFECYCLE_CONCURRENCY = 16
+
+
+def _lifecycle_concurrency() -> int:
+    """Read the binding start/stop concurrency from the environment.
+
+    Returns:
+        The configured limit, or the default when it is unset or not a
+        positive integer
+    """
+    value = os.getenv("BINDING_LIFECYCLE_CONCURRENCY")
+    if value is None:
+        return DEFAULT_BINDING_LIFECYCLE_CONCURRENCY
+    try:
+        limit = int(value)
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        get_logger("binding_manager").warning(
+            "Invalid BINDING_LIFECYCLE_CONCURRENCY '{}', must be a positive "
+            "integer, using {}",
+            value,
+            DEFAULT_BINDING_LIFECYCLE_CONCURRENCY,
+        )
+        return DEFAULT_BINDING_LIFECYCLE_CONCURRENCY
+    return limit
+
+
+BINDING_LIFECYCLE_CONCURRENCY = _lifecycle_concurrency()
+
 
 class Bindings:
     def __init__(self, config_path: str, metrics_service: MetricsService):
@@ -15,26 +56,30 @@ class Bindings:
         self.config = BindingsConfig.load(config_path)
         self.metrics_service = metrics_service
         self.bindings: List[Binding] = []
+        self.bindings_by_name: Dict[str, Binding] = {}
+        # Health checks currently running, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Task] = {}
 
     def init(self):
         try:
             for binding_config in self.config.bindings:
-                self.logger.info(f"Initializing binding: {binding_config.name}")
-
-                if binding_config.type == BindingType.IBM_MQ_TO_KUBEMQ:
-                    source_type = "ibm_mq"
-                    target_type = "kubemq"
-                    source_queue = binding_config.source.queue_name
-                    target_queue = binding_config.target.queue_name
-                elif binding_config.type == BindingType.KUBEMQ_TO_IBM_MQ:
-                    source_type = "kubemq"
-                    target_type = "ibm_mq"
-                    source_queue = binding_config.source.queue_name
-                    target_queue = binding_config.target.queue_name
-                else:
+                self.logger.info("Initializing binding: {}", binding_config.name)
+
+                if binding_config.name in self.bindings_by_name:
+                    raise BindingConfigError(
+                        f"Duplicate binding name '{binding_config.name}'"
+                    )
+
+                try:
+                    (_, source_type), (_, target_type) = BINDING_SIDES[
+                        binding_config.type
+                    ]
+                except KeyError:
                     raise BindingConfigError(
                         f"Unsupported binding type: {binding_config.type}"
                     )
+                source_queue = binding_config.source.queue_name
+                target_queue = binding_config.target.queue_name
 
                 if not source_queue:
                     raise BindingConfigError(
@@ -61,23 +106,91 @@ class Bindings:
                 new_binding = Binding(binding_config, source_metrics, target_metrics)
                 new_binding.init()
                 self.bindings.append(new_binding)
+                self.bindings_by_name[new_binding.name] = new_binding
         except Exception as e:
-            self.logger.exception(f"Error initializing bindings: {str(e)}")
-            raise Exception(f"Error initializing bindings: {str(e)}")
+            self.logger.exception("Error initializing bindings: {}", e)
+            raise
 
     async def start(self):
-        tasks = []
-        for binding in self.bindings:
-            tasks.append(binding.start())
-
-        await asyncio.gather(*tasks)
+        results = await self._gather_bounded(
+            (binding.start for binding in self.bindings),
+            BINDING_LIFECYCLE_CONCURRENCY,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def stop(self):
-        tasks = []
-        for binding in self.bindings:
-            tasks.append(binding.stop())
+        # Every binding is stopped even if some fail, the failures are logged
+        results = await self._gather_bounded(
+            (binding.stop for binding in self.bindings),
+            BINDING_LIFECYCLE_CONCURRENCY,
+        )
+        for binding, result in zip(self.bindings, results):
+            if isinstance(result, BaseException):
+                self.logger.error("Error stopping binding {}: {}", binding.name, result)
+
+    async def _gather_bounded(
+        self,
+        funcs: Iterable[Callable[[], Awaitable[Any]]],
+        limit: int,
+        timeout: float | None = None,
+    ) -> List[Any]:
+        """Run all coroutine functions with at most `limit` of them running at once.
+
+        Args:
+            funcs: Zero-argument coroutine functions to run
+            limit: Maximum number of functions running concurrently
+            timeout: Optional time limit in seconds for each function
 
-        await asyncio.gather(*tasks)
+        Returns:
+            Results in input order, with exceptions returned in place of results
+        """
+        semaphore = asyncio.Semaphore(limit)
+        return await asyncio.gather(
+            *(self._run_bounded(func, semaphore, timeout) for func in funcs),
+            return_exceptions=True,
+        )
+
+    @staticmethod
+    async def _run_bounded(
+        func: Callable[[], Awaitable[Any]],
+        semaphore: asyncio.Semaphore,
+        timeout: float | None,
+    ) -> Any:
+        """Run `func` once the semaphore allows it, within the optional timeout.
+
+        The coroutine is only created once a slot is free, so a call cancelled
+        while waiting for the semaphore leaves no un-awaited coroutine behind.
+        """
+        async with semaphore:
+            deadline = asyncio.timeout(timeout)
+            try:
+                async with deadline:
+                    return await func()
+            except TimeoutError as e:
+                # Only relabel our own deadline, errors raised by func pass through
+                if not deadline.expired():
+                    raise
+                raise TimeoutError(f"Timed out after {timeout} seconds") from e
+
+    async def _coalesce(self, key: str, check) -> Any:
+        """Run a health check, joining one already in flight under the same key.
+
+        Args:
+            key: Identifies the check being run
+            check: Coroutine function performing the check
+
+        Returns:
+            The result of the check
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(check())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield the shared task so one cancelled caller does not cancel the rest
+        return await asyncio.shield(task)
 
     async def is_healthy(self) -> bool:
         """Check if all bindings are healthy.
@@ -85,17 +198,41 @@ class Bindings:
         Returns:
             bool: True if all bindings are healthy, False otherwise
         """
-        for binding in self.bindings:
-            try:
-                if not await binding.is_healthy():
-                    return False
-            except Exception as e:
-                self.logger.error(
-                    f"Error checking health for binding {binding.config.name}: {str(e)}"
-                )
-                return False
+        return await self._coalesce("is_healthy", self._is_healthy)
 
-        return True
+    async def _is_healthy(self) -> bool:
+        semaphore = asyncio.Semaphore(HEALTH_CHECK_CONCURRENCY)
+        pending = {
+            asyncio.create_task(
+                self._run_bounded(
+                    binding.is_healthy, semaphore, HEALTH_CHECK_TIMEOUT_SECONDS
+                )
+            ): binding
+            for binding in self.bindings
+        }
+        try:
+            # Answer as soon as one binding is unhealthy instead of waiting
+            # for the slowest probe
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    binding = pending.pop(task)
+                    error = task.exception()
+                    if error is not None:
+                        self.logger.error(
+                            "Error checking health for binding {}: {}",
+                            binding.name,
+                            error,
+                        )
+                        return False
+                    if not task.result():
+                        return False
+            return True
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def get_detailed_health_status(self) -> Dict[str, Any]:
         """Get detailed health status for all bindings.
@@ -103,30 +240,40 @@ class Bindings:
         Returns:
             Dict containing detailed health information for all bindings
         """
-        # Get overall system health
-        system_healthy = await self.is_healthy()
-
-        health = {
-            "bindings_count": len(self.bindings),
-            "is_healthy": system_healthy,
-            "bindings": {},
-        }
+        return await self._coalesce(
+            "detailed_health_status", self._get_detailed_health_status
+        )
 
+    async def _get_detailed_health_status(self) -> Dict[str, Any]:
         # Get health for each binding
-        for binding in self.bindings:
-            try:
-                binding_health = await binding.get_detailed_health()
-                health["bindings"][binding.config.name] = binding_health
-            except Exception as e:
+        results = await self._gather_bounded(
+            (binding.get_detailed_health for binding in self.bindings),
+            HEALTH_CHECK_CONCURRENCY,
+            HEALTH_CHECK_TIMEOUT_SECONDS,
+        )
+        # Keys are known up front, so the dict is sized once and only filled in
+        bindings_health: Dict[str, Any] = dict.fromkeys(self.bindings_by_name)
+        for binding, result in zip(self.bindings, results):
+            if isinstance(result, BaseException):
                 self.logger.error(
-                    f"Error checking health for binding {binding.config.name}: {str(e)}"
+                    "Error checking health for binding {}: {}", binding.name, result
                 )
-                health["bindings"][binding.config.name] = {
-                    "binding_name": binding.config.name,
+                bindings_health[binding.name] = {
+                    "binding_name": binding.name,
                     "is_healthy": False,
-                    "error": str(e),
+                    "error": str(result),
                     "source": {"is_healthy": False},
                     "target": {"is_healthy": False},
                 }
+            else:
+                bindings_health[binding.name] = result
 
-        return health
+        return {
+            "bindings_count": len(self.bindings),
+            # The system is healthy when every binding is, no need to probe again
+            "is_healthy": all(
+                binding_health.get("is_healthy", False)
+                for binding_health in bindings_health.values()
+            ),
+            "bindings": bindings_health,
+        }
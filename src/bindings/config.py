@@ -7,16 +7,33 @@ from pydantic import BaseModel, Field
 from src.kubemq.config import Config as KubeMQConfig
 from src.ibm_mq.config import Config as IBMMQConfig
 
+# Use libyaml's C loader when PyYAML was built with it
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-class BindingType(Enum):
+
+class BindingType(str, Enum):
     KUBEMQ_TO_IBM_MQ = "kubemq_to_ibm_mq"
     IBM_MQ_TO_KUBEMQ = "ibm_mq_to_kubemq"
 
 
+# Config class and metrics system label of the source and target of each
+# binding type
+BINDING_SIDES = {
+    BindingType.KUBEMQ_TO_IBM_MQ: ((KubeMQConfig, "kubemq"), (IBMMQConfig, "ibm_mq")),
+    BindingType.IBM_MQ_TO_KUBEMQ: ((IBMMQConfig, "ibm_mq"), (KubeMQConfig, "kubemq")),
+}
+
+
 class RetryConfig(BaseModel):
     disable_retry: bool = Field(default=False, description="Disable retry mechanism")
     max_retries: int = Field(default=3, description="Maximum number of retry attempts")
-    delay_seconds: float = Field(default=1.0, description="Delay between retries (seconds)")
+    delay_seconds: float = Field(
+        default=1.0,
+        description="Delay before the first retry (seconds), doubled on each further retry",
+    )
+    max_delay_seconds: float = Field(
+        default=30.0, description="Maximum delay between retries (seconds)"
+    )
 
 
 class BindingConfig(BaseModel):
@@ -44,21 +61,25 @@ class BindingsConfig(BaseModel):
             raise FileNotFoundError(f"Config file not found: {config_path}")
         try:
             with open(config_path, "r") as file:
-                yaml_data: Dict[Any, Any] = yaml.safe_load(file)
+                yaml_data: Dict[Any, Any] = yaml.load(file, Loader=SafeLoader)
 
             # Pre-process the bindings to create proper config objects
             if "bindings" in yaml_data:
                 for binding in yaml_data["bindings"]:
-                    binding_type = BindingType(binding["type"])
-
-                    # Set correct config types based on binding type
-                    if binding_type == BindingType.KUBEMQ_TO_IBM_MQ:
-                        binding["source"] = KubeMQConfig(**binding["source"])
-                        binding["target"] = IBMMQConfig(**binding["target"])
-                    else:  # IBM_MQ_TO_KUBEMQ
-                        binding["source"] = IBMMQConfig(**binding["source"])
-                        binding["target"] = KubeMQConfig(**binding["target"])
+                    # Set correct config types based on binding type. Members
+                    # compare and hash as their values, so the YAML string is
+                    # looked up directly
+                    try:
+                        (source_cls, _), (target_cls, _) = BINDING_SIDES[
+                            binding["type"]
+                        ]
+                    except KeyError:
+                        raise ValueError(
+                            f"'{binding['type']}' is not a valid BindingType"
+                        ) from None
+                    binding["source"] = source_cls.model_validate(binding["source"])
+                    binding["target"] = target_cls.model_validate(binding["target"])
 
-            return BindingsConfig(**yaml_data)
+            return BindingsConfig.model_validate(yaml_data)
         except Exception as e:
             raise ValueError(f"Error loading config file: {str(e)}")
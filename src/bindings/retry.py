@@ -1,4 +1,5 @@
 import asyncio
+import random
 
 
 class RetryWrapper:
@@ -6,37 +7,59 @@ class RetryWrapper:
     A wrapper class to retry an async function call if it raises an exception.
     """
 
-    def __init__(self, max_retries: int = 3, delay_seconds: float = 1.0, logger=None):
+    def __init__(
+        self,
+        max_retries: int = 3,
+        delay_seconds: float = 1.0,
+        max_delay_seconds: float = 30.0,
+        logger=None,
+    ):
         self.max_retries = max_retries
         self.delay_seconds = delay_seconds
+        self.max_delay_seconds = max_delay_seconds
         self.logger = logger
 
     def __call__(self, func):
+        # Settings are fixed once wrapped, read them into locals for the loop
+        max_retries = self.max_retries
+        delay_seconds = self.delay_seconds
+        max_delay_seconds = self.max_delay_seconds
+        logger = self.logger
+
         async def wrapper(*args, **kwargs):
             last_exception = None
             
-            for attempt in range(1, self.max_retries + 1):
+            for attempt in range(1, max_retries + 1):
                 try:
                     return await func(*args, **kwargs)
                 except Exception as e:
                     last_exception = e
                     
-                    if attempt >= self.max_retries:
-                        if self.logger:
-                            self.logger.error(
-                                f"Maximum retry attempts ({self.max_retries}) reached. "
-                                f"Last error: {str(e)}"
+                    if attempt >= max_retries:
+                        if logger:
+                            logger.error(
+                                "Maximum retry attempts ({}) reached. Last error: {}",
+                                max_retries,
+                                e,
                             )
                         raise e
                     
-                    if self.logger:
-                        self.logger.warning(
-                            f"Attempt {attempt}/{self.max_retries} failed: {str(e)}. "
-                            f"Retrying in {self.delay_seconds} seconds..."
+                    # Exponential backoff with jitter, so bindings failing
+                    # together do not retry in lockstep, never above the cap
+                    delay = min(delay_seconds * 2 ** (attempt - 1), max_delay_seconds)
+                    delay = random.uniform(delay / 2, delay)
+
+                    if logger:
+                        logger.warning(
+                            "Attempt {}/{} failed: {}. Retrying in {:.2f} seconds...",
+                            attempt,
+                            max_retries,
+                            e,
+                            delay,
                         )
                         
                     # Wait before next retry
-                    await asyncio.sleep(self.delay_seconds)
+                    await asyncio.sleep(delay)
             
             # This should never be reached but just in case
             assert last_exception is not None
@@ -1,3 +1,4 @@
+import functools
 import os
 from loguru import logger
 import sys
@@ -6,19 +7,25 @@ import sys
 def setup_logging():
     logger.remove()
     log_level = os.getenv("LOG_LEVEL", "DEBUG").upper()
+    # Extended tracebacks inspect every frame's variables, only worth it when
+    # debugging
+    debug_mode = log_level == "DEBUG"
     logger.add(
         sys.stdout,
         level=log_level,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <magenta>{name}</magenta>.<blue>{file}:{line}</blue> (<cyan>{extra[module]}</cyan>) - <level>{message}</level>",
         colorize=True,
-        backtrace=True,
-        diagnose=True,
+        backtrace=debug_mode,
+        diagnose=debug_mode,
     )
 
 
 BaseLogger = logger
 
 
+# Loggers are created per client/binding with a handful of distinct names, so
+# each bound logger is built once and shared
+@functools.lru_cache(maxsize=None)
 def get_logger(module_name: str, queue_name: str = None):
     full_module_name = ""
     if module_name:
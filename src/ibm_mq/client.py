@@ -23,6 +23,10 @@ from pymqi import QueueManager, Queue
 from src.ibm_mq.exceptions import IBMMQConnectionError
 from src.metrics.binding import BindingMetricsHelper
 
+# Extra time given to the polling loop on stop, on top of one get wait interval,
+# to hand the message it is delivering over before it is cancelled
+STOP_GRACE_SECONDS = 5.0
+
 
 class IBMMQClient(Connection):
     """IBM MQ client implementation for connecting to and interacting with IBM MQ services.
@@ -81,7 +85,9 @@ class IBMMQClient(Connection):
         Raises:
             IBMMQConnectionError: If connection to IBM MQ fails
         """
-        self._connect()
+        # Connecting blocks until the channel is up, keep it off the event loop
+        # like the gets and puts, the handle is shared across threads
+        await asyncio.to_thread(self._connect)
 
         # Start the heartbeat task (especially important for non-poll mode)
         self.heartbeat_task = asyncio.create_task(self._periodic_heartbeat())
@@ -93,17 +99,32 @@ class IBMMQClient(Connection):
         to IBM MQ, ensuring proper cleanup of resources.
         """
 
-        if self.is_polling:
-            self.stop_event.set()
-        # Cancel the heartbeat task if running
-        if self.heartbeat_task and not self.heartbeat_task.done():
-            self.heartbeat_task.cancel()
+        self.stop_event.set()
+        self.should_stop_polling = True
+        # Let the polling loop finish the message in hand, a get removes the
+        # message from the queue so cancelling mid-delivery would lose it
+        if self.polling_task and not self.polling_task.done():
             try:
-                await self.heartbeat_task
-            except asyncio.CancelledError:
-                pass
+                await asyncio.wait_for(
+                    self.polling_task,
+                    timeout=self.config.poll_interval_ms / 1000 + STOP_GRACE_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                # wait_for has already cancelled the polling task
+                self.logger.warning("Polling did not stop in time, cancelled it")
+            except Exception as e:
+                self.logger.error("Polling stopped with an error: {}", e)
+        # Cancel the polling and heartbeat tasks if still running
+        for task in (self.polling_task, self.heartbeat_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self.is_polling = False
 
-        self._disconnect()
+        await asyncio.to_thread(self._disconnect)
 
     def _connect(self) -> None:
         """Establish a connection to the IBM MQ server.
@@ -127,29 +148,24 @@ class IBMMQClient(Connection):
             cd.ChannelType = pymqi.CMQC.MQCHT_CLNTCONN
             cd.TransportType = pymqi.CMQC.MQXPT_TCP
 
-            connect_options = pymqi.CMQC.MQCNO_HANDLE_SHARE_BLOCK
-            sco: Optional[pymqi.SCO] = None
+            # pymqi uses an empty SCO when none is given, so always pass one
+            sco = pymqi.SCO()
             if self.config.ssl:
                 cd.SSLCipherSpec = self.config.ssl_cipher_spec.encode("utf-8")
-                sco = pymqi.SCO()
                 sco.KeyRepository = self.config.key_repo_location.encode("utf-8")
 
             self.queue_manager = pymqi.QueueManager(name=None)
-
-            connect_params: dict[str, Any] = {
-                "name": self.config.queue_manager,
-                "cd": cd,
-                "opts": connect_options,
-                "user": self.config.username.encode("utf-8"),
-                "password": (
+            self.queue_manager.connect_with_options(
+                self.config.queue_manager,
+                cd=cd,
+                sco=sco,
+                opts=pymqi.CMQC.MQCNO_HANDLE_SHARE_BLOCK,
+                user=self.config.username.encode("utf-8"),
+                password=(
                     self.config.password.encode("utf-8") if self.config.password else ""
                 ),
-                "HeartbeatInterval": 1,
-            }
-            if sco is not None:
-                connect_params["sco"] = sco
-
-            self.queue_manager.connect_with_options(**connect_params)
+                HeartbeatInterval=1,
+            )
 
         except pymqi.MQMIError as e:
             error_msg = get_error_message(e.reason)
@@ -324,6 +340,15 @@ class IBMMQClient(Connection):
 
         async def _process() -> None:
             connection_broken = False
+            receiver_strategy = None
+
+            # Get-message options are the same for every get, build them once
+            gmo: pymqi.GMO = pymqi.GMO()
+            gmo.Options = pymqi.CMQC.MQGMO_WAIT | pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING
+            gmo.WaitInterval = self.config.poll_interval_ms
+            self.logger.info(
+                "Polling for messages every {}ms", self.config.poll_interval_ms
+            )
 
             while self.is_polling and not self.should_stop_polling:
                 # If connection is broken, attempt to reconnect
@@ -343,29 +368,19 @@ class IBMMQClient(Connection):
                 # Reset the connection_broken flag if we got here
                 try:
                     # Get an appropriate receiver strategy based on the configuration
-                    try:
-                        receiver_strategy = get_receiver_strategy(
-                            self.config.receiver_mode
-                        )
-                    except ValueError as e:
-                        self.logger.error(str(e))
-                        # Configuration errors need manual intervention, so sleep longer
-                        await asyncio.sleep(5.0)
-                        continue
+                    if receiver_strategy is None:
+                        try:
+                            receiver_strategy = get_receiver_strategy(
+                                self.config.receiver_mode
+                            )
+                        except ValueError as e:
+                            self.logger.error(str(e))
+                            # Configuration errors need manual intervention, so sleep longer
+                            await asyncio.sleep(5.0)
+                            continue
 
-                    # Prepare message descriptor and get-message options
+                    # Prepare a fresh message descriptor for this get
                     md: pymqi.MD = pymqi.MD()
-                    gmo: pymqi.GMO = pymqi.GMO()
-                    gmo.Options = (
-                        pymqi.CMQC.MQGMO_WAIT | pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING
-                    )
-                    gmo.WaitInterval = self.config.poll_interval_ms
-
-                    if not hasattr(self, "poll_log_shown"):
-                        self.logger.info(
-                            f"Polling for messages every {self.config.poll_interval_ms}ms"
-                        )
-                        setattr(self, "poll_log_shown", True)
 
                     try:
                         message = await receiver_strategy.receive_message(
@@ -374,10 +389,8 @@ class IBMMQClient(Connection):
 
                         cleaned_message: bytes = self.extract_xml_payload(message)
                         if self.config.log_received_messages:
-                            self.logger.debug(f"Received message")
-                            self.logger.trace(
-                                f"\n{gmo.__str__()}\n{md.__str__()}\n{cleaned_message}"
-                            )
+                            self.logger.debug("Received message")
+                            self.logger.trace("\n{}\n{}\n{}", gmo, md, cleaned_message)
                         await self.metrics.increment_received_message_and_volume(
                             len(cleaned_message), 1
                         )
@@ -385,7 +398,7 @@ class IBMMQClient(Connection):
                             await callback(cleaned_message)
                         except Exception as callback_error:
                             self.logger.error(
-                                f"Error in sending to kubemq target: {str(callback_error)}"
+                                "Error in sending to kubemq target: {}", callback_error
                             )
                             self.last_error = callback_error
 
@@ -405,14 +418,18 @@ class IBMMQClient(Connection):
                                 e.reason != pymqi.CMQC.MQRC_NO_MSG_AVAILABLE
                             ):  # Don't log no message available
                                 self.logger.debug(
-                                    f"Transient error: {error_msg} (Reason: {e.reason})"
+                                    "Transient error: {} (Reason: {})",
+                                    error_msg,
+                                    e.reason,
                                 )
                             await asyncio.sleep(0.1)
 
                         elif error_type == ErrorType.CONNECTION:
                             # For connection errors, trigger a reconnection
                             self.logger.error(
-                                f"Connection error: {error_msg} (Reason: {e.reason}). Will attempt to reconnect."
+                                "Connection error: {} (Reason: {}). Will attempt to reconnect.",
+                                error_msg,
+                                e.reason,
                             )
 
                             connection_broken = True
@@ -422,7 +439,9 @@ class IBMMQClient(Connection):
                         elif error_type == ErrorType.SHUTDOWN:
                             # For shutdown errors, wait longer before reconnecting
                             self.logger.warning(
-                                f"Queue manager shutting down: {error_msg} (Reason: {e.reason}). Will attempt to reconnect after delay."
+                                "Queue manager shutting down: {} (Reason: {}). Will attempt to reconnect after delay.",
+                                error_msg,
+                                e.reason,
                             )
                             connection_broken = True
                             self.is_connected = False
@@ -432,7 +451,9 @@ class IBMMQClient(Connection):
                         else:
                             # For permanent or configuration errors, log error but keep trying
                             self.logger.error(
-                                f"Error polling for message: {error_msg} (Reason: {e.reason})"
+                                "Error polling for message: {} (Reason: {})",
+                                error_msg,
+                                e.reason,
                             )
                             self.last_error = e
                             await asyncio.sleep(
@@ -440,9 +461,7 @@ class IBMMQClient(Connection):
                             )  # Slightly longer delay for permanent errors
 
                     except Exception as e:
-                        self.logger.error(
-                            f"Unexpected error polling for message: {str(e)}"
-                        )
+                        self.logger.error("Unexpected error polling for message: {}", e)
                         await self.metrics.increment_received_error(1)
                         self.last_error = e
                         # Mark connection as broken for most exceptions to trigger reconnection
@@ -450,7 +469,7 @@ class IBMMQClient(Connection):
                             connection_broken = True
                             self.is_connected = False
                 except Exception as e:
-                    self.logger.error(f"Error in polling loop: {str(e)}")
+                    self.logger.error("Error in polling loop: {}", e)
                     self.last_error = e
                     # Mark connection as broken for most exceptions to trigger reconnection
                     if self.is_connected:
@@ -509,7 +528,7 @@ class IBMMQClient(Connection):
         # Convert bytes to string for processing by the strategy
         message_str = message.decode("utf-8")
         if self.config.log_sent_messages:
-            self.logger.info(f"Sending message: {message_str}")
+            self.logger.info("Sending message: {}", message_str)
 
         # Now proceed with sending using the strategy pattern
         async def _send_message():
@@ -523,14 +542,16 @@ class IBMMQClient(Connection):
 
                 # Use the strategy to send the message
                 self.logger.debug("Sending message to IBM MQ")
-                self.logger.trace(f"{message_str}")
+                self.logger.trace("{}", message_str)
                 await sender_strategy.send_message(self.queue, message_str, self.config)
                 await self.metrics.increment_sent_message_and_volume(len(message), 1)
             except pymqi.MQMIError as e:
                 error_msg = get_error_message(e.reason)
                 error_type = classify_error(error_msg)
                 self.logger.error(
-                    f"Error sending message to IBM MQ: {error_msg} (Reason: {e.reason})"
+                    "Error sending message to IBM MQ: {} (Reason: {})",
+                    error_msg,
+                    e.reason,
                 )
                 await self.metrics.increment_sent_error(1)
                 # For connection-related errors, attempt reconnection
@@ -549,9 +570,7 @@ class IBMMQClient(Connection):
                     f"Error sending message to IBM MQ: {error_msg}"
                 )
             except Exception as e:
-                self.logger.error(
-                    f"Unexpected error sending message to IBM MQ: {str(e)}"
-                )
+                self.logger.error("Unexpected error sending message to IBM MQ: {}", e)
                 await self.metrics.increment_sent_error(1)
                 raise IBMMQConnectionError(
                     f"Unexpected error sending message to IBM MQ: {str(e)}"
@@ -631,7 +650,14 @@ class IBMMQClient(Connection):
         """
         while not self.stop_event.is_set():
             try:
-                await asyncio.sleep(self.heartbeat_interval)
+                # Wait for the next heartbeat, waking up early if the client stops
+                try:
+                    await asyncio.wait_for(
+                        self.stop_event.wait(), timeout=self.heartbeat_interval
+                    )
+                    break
+                except asyncio.TimeoutError:
+                    pass
 
                 # Skip heartbeat check if we're already trying to reconnect
                 if self.is_connected and not self.stop_event.is_set():
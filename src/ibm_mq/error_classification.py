@@ -68,6 +68,27 @@ SHUTDOWN_ERRORS: Set[int] = {
     pymqi.CMQC.MQRC_CONNECTION_QUIESCING,  # Connection quiescing
 }
 
+# Human-readable messages for common MQ reason codes
+ERROR_MESSAGES: Dict[int, str] = {
+    # Transient errors
+    pymqi.CMQC.MQRC_NO_MSG_AVAILABLE: "No message available on the queue",
+    pymqi.CMQC.MQRC_Q_FULL: "Queue is full, cannot put message",
+    pymqi.CMQC.MQRC_RESOURCE_PROBLEM: "Temporary resource constraint",
+    pymqi.CMQC.MQRC_BACKED_OUT: "Message was backed out",
+    # Connection errors
+    pymqi.CMQC.MQRC_CONNECTION_BROKEN: "Connection to IBM MQ server was lost",
+    pymqi.CMQC.MQRC_CONNECTION_ERROR: "Error establishing connection to IBM MQ",
+    pymqi.CMQC.MQRC_Q_MGR_NOT_AVAILABLE: "Queue manager is not available",
+    pymqi.CMQC.MQRC_HOST_NOT_AVAILABLE: "IBM MQ host is not available",
+    # Configuration errors
+    pymqi.CMQC.MQRC_UNKNOWN_OBJECT_NAME: "Queue name not found or incorrect",
+    pymqi.CMQC.MQRC_NOT_AUTHORIZED: "Not authorized to access the requested resource",
+    pymqi.CMQC.MQRC_SSL_CONFIG_ERROR: "SSL configuration error",
+    # Shutdown errors
+    pymqi.CMQC.MQRC_Q_MGR_QUIESCING: "Queue manager is quiescing",
+    pymqi.CMQC.MQRC_Q_MGR_STOPPING: "Queue manager is stopping",
+}
+
 
 def classify_error(error_reason: int) -> ErrorType:
     """Classify an IBM MQ error based on its reason code.
@@ -193,27 +214,6 @@ def get_error_message(error_reason: int) -> str:
     Returns:
         str: A descriptive message about the error
     """
-    # Map of error codes to human-readable messages
-    error_messages = {
-        # Transient errors
-        pymqi.CMQC.MQRC_NO_MSG_AVAILABLE: "No message available on the queue",
-        pymqi.CMQC.MQRC_Q_FULL: "Queue is full, cannot put message",
-        pymqi.CMQC.MQRC_RESOURCE_PROBLEM: "Temporary resource constraint",
-        pymqi.CMQC.MQRC_BACKED_OUT: "Message was backed out",
-        # Connection errors
-        pymqi.CMQC.MQRC_CONNECTION_BROKEN: "Connection to IBM MQ server was lost",
-        pymqi.CMQC.MQRC_CONNECTION_ERROR: "Error establishing connection to IBM MQ",
-        pymqi.CMQC.MQRC_Q_MGR_NOT_AVAILABLE: "Queue manager is not available",
-        pymqi.CMQC.MQRC_HOST_NOT_AVAILABLE: "IBM MQ host is not available",
-        # Configuration errors
-        pymqi.CMQC.MQRC_UNKNOWN_OBJECT_NAME: "Queue name not found or incorrect",
-        pymqi.CMQC.MQRC_NOT_AUTHORIZED: "Not authorized to access the requested resource",
-        pymqi.CMQC.MQRC_SSL_CONFIG_ERROR: "SSL configuration error",
-        # Shutdown errors
-        pymqi.CMQC.MQRC_Q_MGR_QUIESCING: "Queue manager is quiescing",
-        pymqi.CMQC.MQRC_Q_MGR_STOPPING: "Queue manager is stopping",
-    }
-
-    return error_messages.get(
+    return ERROR_MESSAGES.get(
         error_reason, f"IBM MQ error with reason code: {error_reason}"
     )
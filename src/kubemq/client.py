@@ -1,9 +1,13 @@
 import asyncio
 import os
+import random
+import threading
 from asyncio import Event
 
 
 from kubemq.queues import Client, QueueMessage
+from kubemq.queues.downstream_receiver import DownstreamReceiver
+from kubemq.queues.upstream_sender import UpstreamSender
 
 from src.bindings.connection import Connection
 from src.kubemq.exceptions import KubeMQConnectionError
@@ -12,6 +16,67 @@ from src.kubemq.config import Config
 from src.common.log import get_logger
 from src.metrics.binding import BindingMetricsHelper
 
+# Upper bound for the delay between polls after consecutive errors
+MAX_POLL_ERROR_DELAY_SECONDS = 30
+
+# Connections shared by all clients using the same server and client id,
+# with the number of clients currently holding each one
+_shared_clients: dict[tuple, list] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _new_client(address: str, client_id) -> Client:
+    """Create a KubeMQ client with its send and receive streams already open.
+
+    Client opens these streams lazily on first use without a lock, so clients
+    sharing it from worker threads could each open one and settle messages
+    on the wrong stream. Opening them up front leaves exactly one of each.
+    """
+    client = Client(address=address, client_id=client_id)
+    client.upstream_sender = UpstreamSender(
+        client.transport,
+        client.logger,
+        client.connection,
+        send_timeout=client.send_timeout,
+    )
+    client.downstream_receiver = DownstreamReceiver(
+        client.transport,
+        client.logger,
+        client.connection,
+    )
+    return client
+
+
+def _acquire_client(address: str, client_id) -> Client:
+    """Return the shared KubeMQ client for address/client_id, creating it if needed."""
+    key = (address, client_id)
+    with _shared_clients_lock:
+        entry = _shared_clients.get(key)
+        if entry is None:
+            entry = _shared_clients[key] = [_new_client(address, client_id), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+async def _release_client(address: str, client_id, logger) -> None:
+    """Release a shared KubeMQ client, closing it once no client holds it."""
+    key = (address, client_id)
+    with _shared_clients_lock:
+        entry = _shared_clients.get(key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _shared_clients[key]
+    try:
+        await entry[0].close_async()
+    except Exception as e:
+        # kubemq 3.5.3 closes the streams and the gRPC channel, then fails to
+        # close its async channel from a worker thread. This client never uses
+        # the async channel, so it is left to be closed at process exit
+        logger.debug("Error closing KubeMQ client: {}", e)
+
 
 class KubeMQClient(Connection):
     def __init__(self, config: Config, metrics_helper: BindingMetricsHelper):
@@ -32,25 +97,35 @@ class KubeMQClient(Connection):
         self.stop_event: Event = Event()
         self.connection_status_lock = asyncio.Lock()
         self.is_connected = False
+        # Status last written to the connection status gauge
+        self.reported_status: bool | None = None
         self.polling_task: asyncio.Task | None = None
 
     async def start(self):
         await self._connect()
 
     async def stop(self):
-        if self.is_polling:
-            self.stop_event.set()
+        self.stop_event.set()
+        # Cancel the polling task if running
+        if self.polling_task and not self.polling_task.done():
+            self.polling_task.cancel()
+            try:
+                await self.polling_task
+            except asyncio.CancelledError:
+                pass
         await self._disconnect()
 
     async def _connect(self):
         try:
-            self.client = Client(
-                address=self.config.address,
-                client_id=self.config.client_id,
-            )
+            self.client = _acquire_client(self.config.address, self.config.client_id)
             await self.client.ping_async()
         except Exception as e:
             self.logger.error(f"Error connecting to kubemq server: {str(e)}")
+            if self.client is not None:
+                self.client = None
+                await _release_client(
+                    self.config.address, self.config.client_id, self.logger
+                )
             await self._update_connection_status(False)
             raise KubeMQConnectionError(
                 f"Error Connecting to queue manager, reason: {str(e)}"
@@ -62,6 +137,11 @@ class KubeMQClient(Connection):
         try:
             await self._update_connection_status(False)
             self.logger.info("Disconnecting from Kubemq")
+            if self.client is not None:
+                self.client = None
+                await _release_client(
+                    self.config.address, self.config.client_id, self.logger
+                )
         except Exception as e:
             self.logger.exception(
                 f"Error disconnecting from Kubemq server, reason: {str(e)}"
@@ -77,69 +157,160 @@ class KubeMQClient(Connection):
             self.logger.error("Callback function not provided")  #
             raise ValueError("Callback function not provided")
 
-        async def _process():
+        # Batches fetched ahead of the one currently being processed, so the
+        # next receive round-trip overlaps with callback processing
+        batches: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+        async def _fetch():
+            error_delay = self.config.poll_interval_seconds
             while not self.stop_event.is_set():
                 try:
                     poll_response = await self.client.receive_queues_messages_async(
                         channel=self.config.queue_name,
-                        max_messages=1,
+                        max_messages=self.config.poll_max_messages,
                         wait_timeout_in_seconds=self.config.poll_interval_seconds,
                     )
                     if poll_response.is_error:
                         self.logger.error(
-                            f"Error polling messages: {poll_response.error}"
+                            "Error polling messages: {}", poll_response.error
                         )
                         await self._update_connection_status(False)
                         await self.metrics.increment_received_error(1)
-                        await asyncio.sleep(self.config.poll_interval_seconds)
+                        error_delay = await self._backoff(error_delay)
                         continue
 
+                    error_delay = self.config.poll_interval_seconds
                     await self._update_connection_status(True)
 
                     if len(poll_response.messages) == 0:
                         continue
                     self.logger.debug(
-                        f"Received {len(poll_response.messages)} messages"
+                        "Received {} messages", len(poll_response.messages)
                     )
+                    try:
+                        await batches.put(poll_response)
+                    except asyncio.CancelledError:
+                        # Stopped before the batch was handed over, release it
+                        self._reject_batch(poll_response)
+                        raise
+                except Exception as e:
+                    self.logger.error("Error polling messages: {}", e)
+                    error_delay = await self._backoff(error_delay)
+
+        async def _process():
+            while True:
+                poll_response = await batches.get()
+                processed_messages = []
+                try:
                     for message in poll_response.messages:
                         try:
-                            self.logger.trace(f"{message.body}")
+                            self.logger.trace("{}", message.body)
                             await callback(message.body)
                             is_message_processed = True
                         except Exception as callback_error:
                             self.logger.error(
-                                f"Error in callback function: {str(callback_error)}, rejecting message"
+                                "Error in callback function: {}, rejecting message",
+                                callback_error,
                             )
                             is_message_processed = False
+                        processed_messages.append((message, is_message_processed))
                         await self.metrics.increment_received_message_and_volume(
                             len(message.body), 1
                         )
-                        try:
-                            if is_message_processed:
-                                message.ack()
-                            else:
-                                message.reject()
-                        except Exception as e:
-                            self.logger.error(
-                                f"Error acknowledging/rejecting message: {str(e)}"
-                            )
-                            await asyncio.sleep(self.config.poll_interval_seconds)
+                    try:
+                        # Settle the whole batch with a single ack when every
+                        # message was processed, otherwise settle one by one
+                        if all(processed for _, processed in processed_messages):
+                            poll_response.ack_all()
+                        else:
+                            for message, is_message_processed in processed_messages:
+                                if is_message_processed:
+                                    message.ack()
+                                else:
+                                    message.reject()
+                    except Exception as e:
+                        self.logger.error(
+                            "Error acknowledging/rejecting messages: {}", e
+                        )
+                        await asyncio.sleep(self.config.poll_interval_seconds)
 
+                except asyncio.CancelledError:
+                    # Stopped mid-batch: settle the messages already handled so
+                    # they are not redelivered, and release the rest
+                    self._settle_partial_batch(poll_response, processed_messages)
+                    raise
                 except Exception as e:
-                    self.logger.error(f"Error processing message: {str(e)}")
+                    self.logger.error("Error processing message: {}", e)
                     await asyncio.sleep(self.config.poll_interval_seconds)
 
-        self.polling_task = asyncio.create_task(_process())
+        async def _run():
+            fetch_task = asyncio.create_task(_fetch())
+            process_task = asyncio.create_task(_process())
+            try:
+                # The processor only ends on cancellation, so the pipeline
+                # lives until the fetcher observes the stop event
+                await fetch_task
+            finally:
+                process_task.cancel()
+                fetch_task.cancel()
+                # Let both tasks settle the batch they hold, then release the
+                # batch still waiting in the queue so its messages are not
+                # left locked while a shared connection stays open
+                await asyncio.gather(fetch_task, process_task, return_exceptions=True)
+                while not batches.empty():
+                    self._reject_batch(batches.get_nowait())
+
+        self.polling_task = asyncio.create_task(_run())
         return self.polling_task
 
+    def _reject_batch(self, poll_response):
+        """Reject every message of a batch that will not be processed."""
+        try:
+            poll_response.reject_all()
+        except Exception as e:
+            self.logger.error("Error rejecting messages: {}", e)
+
+    def _settle_partial_batch(self, poll_response, processed_messages):
+        """Settle a batch whose processing was interrupted.
+
+        Args:
+            poll_response: Batch being processed
+            processed_messages: (message, is_message_processed) pairs of the
+                messages whose callback completed
+        """
+        try:
+            for message, is_message_processed in processed_messages:
+                if is_message_processed:
+                    message.ack()
+                else:
+                    message.reject()
+            for message in poll_response.messages[len(processed_messages) :]:
+                message.reject()
+        except Exception as e:
+            self.logger.error("Error acknowledging/rejecting messages: {}", e)
+
+    async def _backoff(self, delay: float) -> float:
+        """Sleep for a jittered delay after a polling error.
+
+        Args:
+            delay (float): Current backoff delay in seconds
+
+        Returns:
+            float: Delay to use after the next consecutive error
+        """
+        await asyncio.sleep(
+            min(delay * random.uniform(0.5, 1.5), MAX_POLL_ERROR_DELAY_SECONDS)
+        )
+        return min(delay * 2, MAX_POLL_ERROR_DELAY_SECONDS)
+
     async def is_healthy(self) -> bool:
-        with await self.connection_status_lock:
+        async with self.connection_status_lock:
             return self.is_connected
 
     async def send_message(self, message: bytes):
         try:
-            self.logger.debug(f"Sending message")
-            self.logger.trace(f"{message}")
+            self.logger.debug("Sending message")
+            self.logger.trace("{}", message)
             result = await self.client.send_queues_message_async(
                 QueueMessage(
                     body=message,
@@ -147,17 +318,22 @@ class KubeMQClient(Connection):
                 ),
             )
             if result.is_error:
-                self.logger.error(f"Error sending message: {result.error}")
+                self.logger.error("Error sending message: {}", result.error)
                 await self._update_connection_status(False)
                 await self.metrics.increment_sent_error(1)
 
             await self._update_connection_status(True)
             await self.metrics.increment_sent_message_and_volume(len(message), 1)
-            self.logger.debug(f"Message sent successfully")
+            self.logger.debug("Message sent successfully")
         except Exception as e:
-            self.logger.error(f"Error sending message: {str(e)}")
+            self.logger.error("Error sending message: {}", e)
 
     async def _update_connection_status(self, is_connected: bool):
+        # Called for every poll and send, only a change of status needs the
+        # lock and a gauge update
+        if self.reported_status is is_connected:
+            return
         async with self.connection_status_lock:
             self.is_connected = is_connected
+            self.reported_status = is_connected
             await self.metrics.set_connection_status(is_connected)
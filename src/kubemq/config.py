@@ -25,3 +25,6 @@ class Config(BaseModel):
     poll_interval_seconds: int = Field(
         default=1, ge=1, description="Poll interval in seconds"
     )
+    poll_max_messages: int = Field(
+        default=10, ge=1, description="Maximum messages to receive per poll"
+    )
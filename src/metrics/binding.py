@@ -11,6 +11,14 @@ class BindingMetricsHelper:
     Provides simpler async methods to update metrics.
     """
 
+    __slots__ = (
+        "_service",
+        "_binding_name",
+        "_binding_type",
+        "_queue_name",
+        "_logger",
+    )
+
     def __init__(
         self,
         metrics_service: MetricsService,
@@ -109,20 +117,14 @@ class BindingMetricsHelper:
             # If count was valid, should we still update it? Let's return for simplicity.
             return
 
-        # Call both underlying service methods sequentially
-        await self._service.increment_message_count(
-            binding_name=self._binding_name,
-            binding_type=self._binding_type,
-            queue_name=self._queue_name,
-            direction="sent",
-            count=count,
-        )
-        await self._service.increment_message_volume(
+        # Update both counters with a single service call
+        await self._service.increment_message_count_and_volume(
             binding_name=self._binding_name,
             binding_type=self._binding_type,
             queue_name=self._queue_name,
             direction="sent",
             volume=volume,
+            count=count,
         )
 
     async def increment_received_message_and_volume(self, volume: int, count: int = 1):
@@ -138,20 +140,14 @@ class BindingMetricsHelper:
             )
             return
 
-        # Call both underlying service methods sequentially
-        await self._service.increment_message_count(
-            binding_name=self._binding_name,
-            binding_type=self._binding_type,
-            queue_name=self._queue_name,
-            direction="received",
-            count=count,
-        )
-        await self._service.increment_message_volume(
+        # Update both counters with a single service call
+        await self._service.increment_message_count_and_volume(
             binding_name=self._binding_name,
             binding_type=self._binding_type,
             queue_name=self._queue_name,
             direction="received",
             volume=volume,
+            count=count,
         )
 
     async def increment_sent_error(self, count: int = 1):
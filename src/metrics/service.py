@@ -1,5 +1,3 @@
-import asyncio
-import functools
 from prometheus_client import Counter, Gauge, start_http_server
 
 from src.common.log import get_logger
@@ -28,11 +26,19 @@ CONNECTION_STATUS = Gauge(
     ["binding_name", "binding_type", "queue_name"],
 )
 
+# Valid values of the direction label
+DIRECTIONS = frozenset(("sent", "received"))
 
+
+# Metric updates are applied inline: prometheus_client children guard their
+# values with a lock, so they are safe to update from any thread, and an
+# update is far cheaper than handing it to an executor thread.
 class MetricsService:
     def __init__(self, port: int):
         self.port = port
         self.logger = get_logger("metrics.service")
+        # Labelled metric children, resolved once per label set
+        self._children: dict = {}
 
     def start(self):
         """Starts the Prometheus HTTP server in a background thread."""
@@ -53,11 +59,13 @@ class MetricsService:
             "Metrics service stopping (Note: Prometheus server runs as daemon)."
         )
 
-    async def _run_sync(self, func, *args, **kwargs):
-        """Runs a synchronous function in a thread pool executor."""
-        # For Python 3.9+
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+    def _child(self, metric, *labelvalues):
+        """Returns the metric's child for label values in declaration order."""
+        key = (metric, labelvalues)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = metric.labels(*labelvalues)
+        return child
 
     async def increment_message_count(
         self,
@@ -68,21 +76,19 @@ class MetricsService:
         count: int = 1,
     ):
         """Increments the message count."""
-        if direction not in ["sent", "received"]:
+        if direction not in DIRECTIONS:
             self.logger.warning(
                 f"Invalid direction '{direction}' for increment_message_count"
             )
             return
         try:
-            await self._run_sync(
-                TOTAL_MESSAGES_COUNT.labels(
-                    binding_name=binding_name,
-                    binding_type=binding_type,
-                    direction=direction,
-                    queue_name=queue_name,
-                ).inc,  # Pass the method itself
-                count,  # Argument for the inc method
-            )
+            self._child(
+                TOTAL_MESSAGES_COUNT,
+                binding_name,
+                binding_type,
+                direction,
+                queue_name,
+            ).inc(count)
         except Exception as e:
             self.logger.error(f"Error incrementing message count: {e}")
 
@@ -95,24 +101,48 @@ class MetricsService:
         volume: int,
     ):
         """Increments the message volume."""
-        if direction not in ["sent", "received"]:
+        if direction not in DIRECTIONS:
             self.logger.warning(
                 f"Invalid direction '{direction}' for increment_message_volume"
             )
             return
         try:
-            await self._run_sync(
-                TOTAL_MESSAGES_VOLUME.labels(
-                    binding_name=binding_name,
-                    binding_type=binding_type,
-                    direction=direction,
-                    queue_name=queue_name,
-                ).inc,  # Pass the method itself
-                volume,  # Argument for the inc method
-            )
+            self._child(
+                TOTAL_MESSAGES_VOLUME,
+                binding_name,
+                binding_type,
+                direction,
+                queue_name,
+            ).inc(volume)
         except Exception as e:
             self.logger.error(f"Error incrementing message volume: {e}")
 
+    async def increment_message_count_and_volume(
+        self,
+        binding_name: str,
+        binding_type: str,
+        queue_name: str,
+        direction: str,
+        volume: int,
+        count: int = 1,
+    ):
+        """Increments the message count and volume with a single call."""
+        if direction not in DIRECTIONS:
+            self.logger.warning(
+                f"Invalid direction '{direction}' for "
+                "increment_message_count_and_volume"
+            )
+            return
+        try:
+            self._child(
+                TOTAL_MESSAGES_COUNT, binding_name, binding_type, direction, queue_name
+            ).inc(count)
+            self._child(
+                TOTAL_MESSAGES_VOLUME, binding_name, binding_type, direction, queue_name
+            ).inc(volume)
+        except Exception as e:
+            self.logger.error(f"Error incrementing message count and volume: {e}")
+
     async def increment_error_count(
         self,
         binding_name: str,
@@ -122,21 +152,19 @@ class MetricsService:
         count: int = 1,
     ):
         """Increments the error count."""
-        if direction not in ["sent", "received"]:
+        if direction not in DIRECTIONS:
             self.logger.warning(
                 f"Invalid direction '{direction}' for increment_error_count"
             )
             return
         try:
-            await self._run_sync(
-                TOTAL_ERRORS_COUNT.labels(
-                    binding_name=binding_name,
-                    binding_type=binding_type,
-                    direction=direction,
-                    queue_name=queue_name,
-                ).inc,  # Pass the method itself
-                count,  # Argument for the inc method
-            )
+            self._child(
+                TOTAL_ERRORS_COUNT,
+                binding_name,
+                binding_type,
+                direction,
+                queue_name,
+            ).inc(count)
         except Exception as e:
             self.logger.error(f"Error incrementing error count: {e}")
 
@@ -145,13 +173,8 @@ class MetricsService:
     ):
         """Sets the connection status gauge."""
         try:
-            await self._run_sync(
-                CONNECTION_STATUS.labels(
-                    binding_name=binding_name,
-                    binding_type=binding_type,
-                    queue_name=queue_name,
-                ).set,  # Pass the method itself
-                int(status),  # Argument for the set method
+            self._child(CONNECTION_STATUS, binding_name, binding_type, queue_name).set(
+                int(status)
             )
         except Exception as e:
             self.logger.error(f"Error setting connection status: {e}")
@@ -161,12 +184,7 @@ class MetricsService:
     ):
         """Sets the connection status gauge."""
         try:
-
-            CONNECTION_STATUS.labels(
-                binding_name=binding_name,
-                binding_type=binding_type,
-                queue_name=queue_name,
-            ).set(
+            self._child(CONNECTION_STATUS, binding_name, binding_type, queue_name).set(
                 int(status)
             )  # Argument for the set method
 